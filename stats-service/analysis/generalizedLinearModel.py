@@ -1,8 +1,17 @@
+import math
+from types import SimpleNamespace
+
 import numpy as np
-import pandas as pd
 import statsmodels.api as sm
 from statsmodels.tools.sm_exceptions import PerfectSeparationError
 
+from .utils import finite_design
+
+try:
+    from scipy.stats import chi2 as _chi2
+except Exception:
+    _chi2 = None
+
 
 def get_family(family_name: str):
     """
@@ -33,6 +42,13 @@ def _safe_float(x):
         return None
 
 
+def _finite(x):
+    """
+    float(x) for a finite number, else None. For values read straight off a fit result.
+    """
+    return float(x) if x is not None and math.isfinite(x) else None
+
+
 def _safe_round(x, nd=4):
     xf = _safe_float(x)
     if xf is None:
@@ -40,13 +56,25 @@ def _safe_round(x, nd=4):
     return float(round(xf, nd))
 
 
-def _fit_null_glm(y, family):
+def _null_stats(y, family):
     """
-    Fit an intercept-only GLM for comparisons (null model).
+    Intercept-only GLM (null model) in closed form.
+
+    With a canonical link the null model's fitted mean is simply mean(y),
+    so deviance and log-likelihood can be evaluated directly without IRLS.
+    Returns a namespace exposing .deviance and .llf like a fitted result.
     """
+    y = np.asarray(y, dtype=float)
     n = len(y)
-    X_null = sm.add_constant(np.zeros((n, 1)), has_constant="add")
-    return sm.GLM(y, X_null, family=family).fit()
+    mu0 = np.full(n, np.mean(y))
+
+    deviance = float(family.deviance(y, mu0))
+
+    # statsmodels reports the Gaussian llf at the MLE scale (RSS / n)
+    scale = deviance / n if isinstance(family, sm.families.Gaussian) else 1.0
+    llf = float(family.loglike(y, mu0, scale=scale))
+
+    return SimpleNamespace(deviance=deviance, llf=llf)
 
 
 # ───────────────────────────── GLM equivalents of OLS-style measures ─────────────────────────────
@@ -56,8 +84,13 @@ def _pseudo_r2_deviance(result, null_result):
     Deviance-based pseudo R² ("explained deviance"):
       R²_dev = 1 - (D_model / D_null)
     """ 
-    d_model = _safe_float(getattr(result, "deviance", None))
-    d_null = _safe_float(getattr(null_result, "deviance", None)) if null_result is not None else None
+    if null_result is None:
+        return None
+    try:
+        d_model = _finite(result.deviance)
+        d_null = _finite(null_result.deviance)
+    except Exception:
+        return None
     if d_model is None or d_null is None or d_null <= 0:
         return None
     return 1.0 - (d_model / d_null)
@@ -69,8 +102,13 @@ def _pseudo_r2_mcfadden_adjusted(result, null_result, k):
       R²_adj = 1 - ((llf - k) / llnull)
     where k = number of predictors excluding intercept.
     """
-    llf = _safe_float(getattr(result, "llf", None))
-    llnull = _safe_float(getattr(null_result, "llf", None)) if null_result is not None else None
+    if null_result is None:
+        return None
+    try:
+        llf = _finite(result.llf)
+        llnull = _finite(null_result.llf)
+    except Exception:
+        return None
     if llf is None or llnull is None or llnull == 0:
         return None
     return 1.0 - ((llf - float(k)) / llnull)
@@ -82,65 +120,67 @@ def _lr_test_p_value(result, null_result):
       LR = 2*(ll_full - ll_null) ~ Chi^2(df=k)
     This is the GLM analogue of the "overall F-test" in OLS.
     """
-    llf = _safe_float(getattr(result, "llf", None))
-    llnull = _safe_float(getattr(null_result, "llf", None)) if null_result is not None else None
-    df = int(getattr(result, "df_model", 0))  # excludes intercept
+    if null_result is None or _chi2 is None:
+        return None
+    try:
+        llf = _finite(result.llf)
+        llnull = _finite(null_result.llf)
+        df = int(result.df_model)  # excludes intercept
+    except Exception:
+        return None
 
     if llf is None or llnull is None or df <= 0:
         return None
 
     LR = 2.0 * (llf - llnull)
-    if np.isnan(LR) or np.isinf(LR) or LR < 0:
+    if not math.isfinite(LR) or LR < 0:
         return None
 
-    try:
-        from scipy.stats import chi2
-        return float(chi2.sf(LR, df))
-    except Exception:
-        return None
+    return float(_chi2.sf(LR, df))
 
 
-def _predictive_pseudo_r2_holdout(y, X, family, test_size=0.2, seed=42):
+def _predictive_pseudo_r2_loo(result, y, X, family):
     """
-    Simple predictive GLM analogue of predicted R² using a single holdout split:
-      pred_R² = 1 - (D_test_full / D_test_null)
-
-    Uses deviance on the held-out set (likelihood-based).
+    Predictive GLM analogue of predicted R² (PRESS) using approximate
+    leave-one-out predictions from the full fit, so no model is refit:
+      pred_R² = 1 - (D_loo_full / D_loo_null)
+
+    LOO linear predictors use the one-step update with the final IRLS weights W:
+      eta_(-i) ≈ eta_i - h_ii / (1 - h_ii) * (z_i - eta_i)
+    where h_ii is the diagonal of W^½ X (X'WX)^-1 X' W^½ and z is the working response.
+    For Gaussian the numerator is exactly OLS PRESS. The null model's LOO prediction is the
+    mean of the other n - 1 observations.
     """
     y = np.asarray(y, dtype=float)
     X = np.asarray(X, dtype=float)
-    n = len(y)
-    if n < 30:
-        return None
-
-    rng = np.random.default_rng(seed)
-    idx = np.arange(n)
-    rng.shuffle(idx)
-
-    split = int(round(n * (1.0 - test_size)))
-    train_idx = idx[:split]
-    test_idx = idx[split:]
-    if len(test_idx) < 5 or len(train_idx) < 10:
+    n, p = X.shape
+    if n <= p + 1:
         return None
 
-    y_tr, y_te = y[train_idx], y[test_idx]
-    X_tr, X_te = X[train_idx], X[test_idx]
-
-    # Fit full model on train
-    res_tr = sm.GLM(y_tr, X_tr, family=family).fit()
+    try:
+        mu = np.asarray(result.mu, dtype=float)
+        eta = family.link(mu)
 
-    # Fit null model on train
-    null_tr = _fit_null_glm(y_tr, family)
+        # Leverages from the weighted design (row norms of Q)
+        Q, R = np.linalg.qr(np.sqrt(family.weights(mu))[:, None] * X)
+        r_diag = np.abs(np.diag(R))
+        if r_diag.min() <= 1e-10 * r_diag.max():
+            return None
+        leverage = np.einsum("ij,ij->i", Q, Q)
+        if np.any(leverage >= 1.0 - 1e-12):
+            return None
 
-    # Predict on test
-    mu_full = np.asarray(res_tr.predict(X_te), dtype=float)
-    mu_null = np.asarray(null_tr.predict(sm.add_constant(np.zeros((len(y_te), 1)), has_constant="add")), dtype=float)
+        working_resid = (y - mu) * family.link.deriv(mu)
+        mu_full = family.link.inverse(eta - leverage / (1.0 - leverage) * working_resid)
+        mu_null = (y.sum() - y) / (n - 1)
 
-    # Convert to "test deviance" via deviance residuals
-    d_full = float(np.sum(family.resid_dev(y_te, mu_full) ** 2))
-    d_null = float(np.sum(family.resid_dev(y_te, mu_null) ** 2))
+        # "Predictive deviance" via deviance residuals at the LOO predictions
+        d_full = float(np.sum(family.resid_dev(y, mu_full) ** 2))
+        d_null = float(np.sum(family.resid_dev(y, mu_null) ** 2))
+    except Exception:
+        return None
 
-    if d_null <= 0 or np.isnan(d_full) or np.isnan(d_null) or np.isinf(d_full) or np.isinf(d_null):
+    if d_null <= 0 or not math.isfinite(d_full) or not math.isfinite(d_null):
         return None
 
     return 1.0 - (d_full / d_null)
@@ -153,23 +193,13 @@ def run_glm(y_list, X_dict, family: str, model_name: str | None = None):
     Returned keys match your API shape, BUT they represent GLM equivalents:
       - r2        : deviance pseudo R² (explained deviance)
       - adj_r2    : adjusted McFadden pseudo R²
-      - pred_r2   : predictive pseudo R² (holdout deviance improvement)
+      - pred_r2   : predictive pseudo R² (approximate leave-one-out deviance improvement)
       - f_test_p_value : LR test p-value vs null (overall significance)
 
     Also returns AIC/BIC and coefficients+p-values (native GLM outputs).
     """
-    # 1) DataFrame
-    df = pd.DataFrame(X_dict)
-    df["__y__"] = y_list
-
-    # 2) Drop NaN / inf
-    df = df.replace([np.inf, -np.inf], np.nan).dropna()
-
-    y = df["__y__"].values
-    X = df.drop(columns=["__y__"])
-
-    # 3) Add intercept
-    X = sm.add_constant(X, has_constant="add")
+    # 1-3) Drop NaN / inf rows and add intercept
+    y, X, names = finite_design(y_list, X_dict)
 
     n = int(len(y))
     p = int(X.shape[1])     # incl intercept
@@ -187,29 +217,24 @@ def run_glm(y_list, X_dict, family: str, model_name: str | None = None):
     # 6) Null model (intercept-only)
     null_res = None
     try:
-        null_res = _fit_null_glm(y, fam)
+        null_res = _null_stats(y, fam)
     except Exception:
         null_res = None
 
     # 7) GLM equivalents
     r2_val = _pseudo_r2_deviance(result, null_res)
     adj_r2_val = _pseudo_r2_mcfadden_adjusted(result, null_res, k)
-    pred_r2_val = _predictive_pseudo_r2_holdout(y, X.values, fam, test_size=0.2, seed=42)
+    pred_r2_val = _predictive_pseudo_r2_loo(result, y, X, fam)
     overall_p_val = _lr_test_p_value(result, null_res)
 
-    # 8) AIC/BIC (valid for GLMs)
-    aic = _safe_round(getattr(result, "aic", None), 4)
-
-    bic = None
-    llf = _safe_float(getattr(result, "llf", None))
-    if llf is not None and n > 0:
-        bic = _safe_round((-2.0 * llf + p * np.log(n)), 4)
+    # 8) AIC/BIC (valid for GLMs), both from the same llf (p incl intercept)
+    llf = _finite(result.llf)
+    aic = None if llf is None else -2.0 * llf + 2.0 * p
+    bic = None if llf is None or n <= 0 else -2.0 * llf + p * math.log(n)
 
     # 9) Coefficients + p-values
     coeffs = []
-    for name, coef, p_value in zip(
-        result.params.index, result.params.values, result.pvalues.values
-    ):
+    for name, coef, p_value in zip(names, result.params, result.pvalues):
         coeffs.append(
             {
                 "name": str(name),
@@ -1,8 +1,13 @@
+from types import SimpleNamespace
+
 import numpy as np
-import pandas as pd
+import scipy.linalg
+import scipy.stats
 import statsmodels.api as sm
 
-def compute_predicted_r2(result, y_array):
+from .utils import finite_design
+
+def compute_predicted_r2(press_resid, y_array):
     """
     Compute predicted R² using PRESS:
       PRESS = sum(press_residuals^2)
@@ -10,8 +15,6 @@ def compute_predicted_r2(result, y_array):
       pred_R² = 1 - PRESS / TSS
     """
     try:
-        influence = result.get_influence()
-        press_resid = influence.resid_press
         press = float(np.sum(press_resid ** 2))
 
         tss = float(np.sum((y_array - np.mean(y_array)) ** 2))
@@ -23,6 +26,81 @@ def compute_predicted_r2(result, y_array):
         return None
 
 
+def _fit_ols_qr(y, X):
+    """
+    OLS fit via economic QR, exposing the same summary attributes we read from
+    statsmodels' OLSResults (params, pvalues, rsquared, rsquared_adj, aic, bic,
+    f_pvalue) plus PRESS residuals from the hat diagonal h_ii = sum(Q_i²).
+
+    Returns None when X is rank-deficient, leaves no residual degrees of
+    freedom, fits (near-)exactly or y is (near-)constant; statsmodels
+    handles those cases (pinv, inf/nan statistics) instead.
+    """
+    n, p = X.shape
+    if n <= p:
+        return None
+
+    Q, R = scipy.linalg.qr(X, mode="economic")
+    r_diag = np.abs(np.diag(R))
+    if r_diag.min() <= 1e-10 * r_diag.max():
+        return None
+
+    params = scipy.linalg.solve_triangular(R, Q.T @ y)
+    resid = y - X @ params
+    leverage = np.einsum("ij,ij->i", Q, Q)
+
+    df_model = p - 1  # excludes intercept
+    df_resid = n - p
+    rss = float(resid @ resid)
+    tss = float(np.sum((y - np.mean(y)) ** 2))
+    # (Near-)exact fit or (near-)constant y: rss/tss are then rounding noise and
+    # R², the F-test and p-values degenerate. Relative tolerances, not == 0.
+    if tss <= 1e-24 * float(y @ y) or rss <= 1e-12 * tss:
+        return None
+
+    rsquared = 1.0 - rss / tss
+    rsquared_adj = 1.0 - (n - 1) / df_resid * (1.0 - rsquared)
+
+    llf = -0.5 * n * (np.log(2.0 * np.pi) + np.log(rss / n) + 1.0)
+    aic = -2.0 * llf + 2.0 * p
+    bic = -2.0 * llf + p * np.log(n)
+
+    # Var(beta) = sigma² (R'R)^-1 = sigma² R^-1 R^-T
+    sigma2 = rss / df_resid
+    R_inv = scipy.linalg.solve_triangular(R, np.eye(p))
+    bse = np.sqrt(sigma2 * np.sum(R_inv ** 2, axis=1))
+    pvalues = 2.0 * scipy.stats.t.sf(np.abs(params / bse), df_resid)
+
+    if df_model > 0:
+        f_value = ((tss - rss) / df_model) / sigma2
+        f_pvalue = float(scipy.stats.f.sf(f_value, df_model, df_resid))
+    else:
+        f_pvalue = np.nan
+
+    return SimpleNamespace(
+        params=params,
+        pvalues=pvalues,
+        rsquared=rsquared,
+        rsquared_adj=rsquared_adj,
+        aic=aic,
+        bic=bic,
+        f_pvalue=f_pvalue,
+        resid_press=resid / (1.0 - leverage),
+    )
+
+
+def _fit_ols_statsmodels(y, X):
+    """
+    Fallback OLS fit via statsmodels, with PRESS residuals from its influence object.
+    """
+    result = sm.OLS(y, X).fit()
+    try:
+        result.resid_press = result.get_influence().resid_press
+    except Exception:
+        result.resid_press = None
+    return result
+
+
 def run_linear_regression(y_list, X_dict, model_name=None):
     """
     y_list: [y1, y2, ...]
@@ -31,22 +109,13 @@ def run_linear_regression(y_list, X_dict, model_name=None):
     Returns a plain dict that can be serialized to JSON.
     """
 
-    # Build DataFrame
-    df = pd.DataFrame(X_dict)
-    df["__y__"] = y_list
-
-    # Drop rows with NaN / inf to avoid crashes
-    df = df.replace([np.inf, -np.inf], np.nan).dropna()
-
-    y = df["__y__"].values
-    X = df.drop(columns=["__y__"])
-
-    # Add intercept
-    X = sm.add_constant(X, has_constant="add")
+    # Drop rows with NaN / inf to avoid crashes, add intercept
+    y, X, names = finite_design(y_list, X_dict)
 
     # Fit OLS
-    model = sm.OLS(y, X)
-    result = model.fit()
+    result = _fit_ols_qr(y, X)
+    if result is None:
+        result = _fit_ols_statsmodels(y, X)
 
     # Metrics
     r2 = float(round(result.rsquared,2))
@@ -56,14 +125,12 @@ def run_linear_regression(y_list, X_dict, model_name=None):
     f_test_p_value = (
         float(round(result.f_pvalue, 2)) if result.f_pvalue is not None else None
     )
-    pred_r2_raw = compute_predicted_r2(result, y)
+    pred_r2_raw = compute_predicted_r2(result.resid_press, y)
     pred_r2 = float(round(pred_r2_raw, 2)) if pred_r2_raw is not None else None
 
     # Coefficients
     coeffs = []
-    for name, coef, p_value in zip(
-        result.params.index, result.params.values, result.pvalues.values
-    ):
+    for name, coef, p_value in zip(names, result.params, result.pvalues):
         coeffs.append(
             {
                 "name": str(name),
@@ -0,0 +1,26 @@
+import numpy as np
+import statsmodels.api as sm
+
+
+def finite_design(y_list, X_dict):
+    """
+    Builds (y, X, names) for regression from raw request payload lists.
+
+    All columns are written into one float64 buffer and rows containing
+    NaN / inf in any column are dropped with a single mask.
+    X gets an intercept column first; names are ["const", *X_dict keys].
+    """
+    columns = list(X_dict)
+    n = len(y_list)
+
+    buffer = np.empty((n, len(columns) + 1), dtype=np.float64)
+    buffer[:, 0] = y_list
+    for column_index, column in enumerate(columns):
+        buffer[:, column_index + 1] = X_dict[column]
+
+    buffer = buffer[np.isfinite(buffer).all(axis=1)]
+
+    y = buffer[:, 0]
+    X = sm.add_constant(buffer[:, 1:], has_constant="add")
+    names = ["const"] + [str(column) for column in columns]
+    return y, X, names
@@ -1,7 +1,8 @@
-from fastapi import FastAPI, Body
-from analysis.linearRegression import *
-from analysis.generalizedLinearModel import *
+from fastapi import FastAPI, Body, Response
+from analysis.linearRegression import run_linear_regression
+from analysis.generalizedLinearModel import run_glm
 from seasonality.all_seasonality_indices import compute_seasonality_run
+from seasonality.utils import dumps_safe
 from fastapi.staticfiles import StaticFiles
 
 import os
@@ -55,7 +56,9 @@ def seasonality_endpoint(payload: dict = Body(...)):
         year_month_col="year_month",
         trend_hat_col=payload.get("trend_hat_col"),  # optional
     )
-    return out
+    # Serialize with orjson directly: skips FastAPI's recursive jsonable_encoder
+    # walk over every municipality/month value.
+    return Response(content=dumps_safe(out), media_type="application/json")
 
 
 os.makedirs("exports", exist_ok=True)
@@ -0,0 +1,53 @@
+"""
+Optional Numba kernel for the centered moving average. When numba is missing
+the function runs as plain Python; utils uses its NumPy path instead.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def centered_moving_average_even(values, window, out):
+    """
+    Writes the centered moving average of an even window into out (same length
+    as values, NaN where undefined): out[i] averages the trailing means ending
+    at i and i + 1. One running-sum pass; non-finite values are counted apart
+    so they only blank the windows that contain them.
+    """
+    n = values.shape[0]
+    out[:] = np.nan
+    running_sum = 0.0
+    non_finite = 0
+    previous_mean = np.nan
+    for i in range(n):
+        if np.isfinite(values[i]):
+            running_sum += values[i]
+        else:
+            non_finite += 1
+        if i >= window:
+            if np.isfinite(values[i - window]):
+                running_sum -= values[i - window]
+            else:
+                non_finite -= 1
+        if i >= window - 1:
+            trailing_mean = running_sum / window if non_finite == 0 else np.nan
+            if i >= window:
+                out[i - 1] = 0.5 * (previous_mean + trailing_mean)
+            previous_mean = trailing_mean
+
+
+if NUMBA_AVAILABLE:
+    centered_moving_average_even = njit(cache=True, error_model="numpy")(centered_moving_average_even)
+
+    # Compile (or load from numba's cache) at import rather than inside the first
+    # request. pandas 3 hands out read-only arrays and pandas 2 writable ones: warm both.
+    _warmup_values = np.zeros(1)
+    centered_moving_average_even(_warmup_values, 2, np.empty(1))
+    _warmup_values.flags.writeable = False
+    centered_moving_average_even(_warmup_values, 2, np.empty(1))
+    del _warmup_values
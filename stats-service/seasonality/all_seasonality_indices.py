@@ -1,5 +1,11 @@
+import csv
+import multiprocessing
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from itertools import repeat
 from typing import Dict, Any
 
 import numpy as np
@@ -15,6 +21,121 @@ from .ratio_to_moving_average import ratio_to_moving_average
 from .link_relatives import link_relatives
 from .ratio_to_median import ratio_to_median
 
+INDEX_KEYS = (
+    "A_simple_averages",
+    "B_ratio_to_trend",
+    "C_ratio_to_moving_average",
+    "D_link_relatives",
+    "E_ratio_to_median",
+)
+
+# A group costs ~1 s to plot; a warm worker adds only a few ms of pickling per
+# group, but each spawned worker pays ~1.5 s once to import pandas/matplotlib.
+# Below this many groups (OVERALL included) the serial loop is as fast.
+PARALLEL_MIN_GROUPS = 4
+
+# One worker pool per server process, created on first use and shared by all
+# requests. Spawn (the only start method on Windows) never forks the
+# multi-threaded server process.
+_PROCESS_POOL: ProcessPoolExecutor | None = None
+_PROCESS_POOL_LOCK = threading.Lock()
+
+
+def _process_pool() -> ProcessPoolExecutor:
+    global _PROCESS_POOL
+    with _PROCESS_POOL_LOCK:
+        if _PROCESS_POOL is None:
+            # Default max_workers: cpu_count, capped at 61 on Windows
+            _PROCESS_POOL = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+        return _PROCESS_POOL
+
+
+def _discard_process_pool(broken_pool: ProcessPoolExecutor) -> None:
+    global _PROCESS_POOL
+    with _PROCESS_POOL_LOCK:
+        # Another request may already have replaced it with a healthy pool
+        if _PROCESS_POOL is broken_pool:
+            _PROCESS_POOL = None
+    broken_pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _process_municipality(
+    municipality_name: str,
+    municipality_rows: pd.DataFrame,
+    metric_col: str,
+    plots_dir: str,
+    run_id: str,
+    safe_municipality_name: str,
+) -> Dict[str, Any]:
+    """
+    Computes the 5 indices for one municipality (or OVERALL), saves its 5 plots
+    into plots_dir/safe_municipality_name (created beforehand) and returns its
+    JSON-safe entry for the results dict.
+    Top-level so it can run in a worker process.
+    """
+    # Extract the needed columns once; the index functions work on these arrays
+    y = municipality_rows["y"].to_numpy(dtype=float)
+    month = municipality_rows["month"].to_numpy()
+    trend_hat = municipality_rows["trend_hat"].to_numpy(dtype=float) if "trend_hat" in municipality_rows.columns else None
+
+    # Compute indices (numpy arrays, usually length 12)
+    index_A = simple_averages(y, month)
+    index_B = ratio_to_trend(y, month, municipality_rows["time_index"].to_numpy(), trend_hat)
+    index_C = ratio_to_moving_average(y, month, municipality_rows["date"].to_numpy())
+    index_D = link_relatives(y, month)
+    index_E = ratio_to_median(y, month)
+
+    municipality_plot_folder = os.path.join(plots_dir, safe_municipality_name)
+
+    # Save plots (raw arrays are OK for plotting)
+    plot_seasonal_index(
+        index_A,
+        f"{municipality_name} - A_Simple_Averages ({metric_col})",
+        os.path.join(municipality_plot_folder, "A_simple_averages.png"),
+    )
+    plot_seasonal_index(
+        index_B,
+        f"{municipality_name} - B_Ratio_To_Trend ({metric_col})",
+        os.path.join(municipality_plot_folder, "B_ratio_to_trend.png"),
+    )
+    plot_seasonal_index(
+        index_C,
+        f"{municipality_name} - C_Ratio_To_Moving_Average ({metric_col})",
+        os.path.join(municipality_plot_folder, "C_ratio_to_moving_average.png"),
+    )
+    plot_seasonal_index(
+        index_D,
+        f"{municipality_name} - D_Link_Relatives ({metric_col})",
+        os.path.join(municipality_plot_folder, "D_link_relatives.png"),
+    )
+    plot_seasonal_index(
+        index_E,
+        f"{municipality_name} - E_Ratio_To_Median ({metric_col})",
+        os.path.join(municipality_plot_folder, "E_ratio_to_median.png"),
+    )
+
+    # ✅ IMPORTANT: store JSON-safe lists (no NaN/Inf) for API response + CSV
+    index_A_safe = json_safe_list(index_A)
+    index_B_safe = json_safe_list(index_B)
+    index_C_safe = json_safe_list(index_C)
+    index_D_safe = json_safe_list(index_D)
+    index_E_safe = json_safe_list(index_E)
+
+    return {
+        "A_simple_averages": index_A_safe,
+        "B_ratio_to_trend": index_B_safe,
+        "C_ratio_to_moving_average": index_C_safe,
+        "D_link_relatives": index_D_safe,
+        "E_ratio_to_median": index_E_safe,
+        "plot_files": {
+            "A_simple_averages": f"{run_id}/plots/{safe_municipality_name}/A_simple_averages.png",
+            "B_ratio_to_trend": f"{run_id}/plots/{safe_municipality_name}/B_ratio_to_trend.png",
+            "C_ratio_to_moving_average": f"{run_id}/plots/{safe_municipality_name}/C_ratio_to_moving_average.png",
+            "D_link_relatives": f"{run_id}/plots/{safe_municipality_name}/D_link_relatives.png",
+            "E_ratio_to_median": f"{run_id}/plots/{safe_municipality_name}/E_ratio_to_median.png",
+        },
+    }
+
 
 def compute_seasonality_run(
     raw_df: pd.DataFrame,
@@ -50,90 +171,51 @@ def compute_seasonality_run(
     plots_dir = os.path.join(run_dir, "plots")
     os.makedirs(plots_dir, exist_ok=True)
 
-    results: Dict[str, Any] = {}
-
-    groups = [("OVERALL", monthly_dataframe)] + list(monthly_dataframe.groupby("municipality"))
-
-    for municipality_name, municipality_rows in groups:
-        municipality_rows = municipality_rows.copy()
-
-        # Compute indices (numpy arrays, usually length 12)
-        index_A = simple_averages(municipality_rows)
-        index_B = ratio_to_trend(municipality_rows)
-        index_C = ratio_to_moving_average(municipality_rows)
-        index_D = link_relatives(municipality_rows)
-        index_E = ratio_to_median(municipality_rows)
-
-        # Prepare plot folder
-        safe_municipality_name = safe_filename_component(municipality_name)
-        municipality_plot_folder = os.path.join(plots_dir, safe_municipality_name)
-        os.makedirs(municipality_plot_folder, exist_ok=True)
-
-        # Save plots (raw arrays are OK for plotting)
-        plot_seasonal_index(
-            index_A,
-            f"{municipality_name} - A_Simple_Averages ({metric_col})",
-            os.path.join(municipality_plot_folder, "A_simple_averages.png"),
-        )
-        plot_seasonal_index(
-            index_B,
-            f"{municipality_name} - B_Ratio_To_Trend ({metric_col})",
-            os.path.join(municipality_plot_folder, "B_ratio_to_trend.png"),
-        )
-        plot_seasonal_index(
-            index_C,
-            f"{municipality_name} - C_Ratio_To_Moving_Average ({metric_col})",
-            os.path.join(municipality_plot_folder, "C_ratio_to_moving_average.png"),
-        )
-        plot_seasonal_index(
-            index_D,
-            f"{municipality_name} - D_Link_Relatives ({metric_col})",
-            os.path.join(municipality_plot_folder, "D_link_relatives.png"),
-        )
-        plot_seasonal_index(
-            index_E,
-            f"{municipality_name} - E_Ratio_To_Median ({metric_col})",
-            os.path.join(municipality_plot_folder, "E_ratio_to_median.png"),
-        )
-
-        # ✅ IMPORTANT: store JSON-safe lists (no NaN/Inf) for API response + CSV
-        index_A_safe = json_safe_list(index_A)
-        index_B_safe = json_safe_list(index_B)
-        index_C_safe = json_safe_list(index_C)
-        index_D_safe = json_safe_list(index_D)
-        index_E_safe = json_safe_list(index_E)
-
-        results[municipality_name] = {
-            "A_simple_averages": index_A_safe,
-            "B_ratio_to_trend": index_B_safe,
-            "C_ratio_to_moving_average": index_C_safe,
-            "D_link_relatives": index_D_safe,
-            "E_ratio_to_median": index_E_safe,
-            "plot_files": {
-                "A_simple_averages": f"{run_id}/plots/{safe_municipality_name}/A_simple_averages.png",
-                "B_ratio_to_trend": f"{run_id}/plots/{safe_municipality_name}/B_ratio_to_trend.png",
-                "C_ratio_to_moving_average": f"{run_id}/plots/{safe_municipality_name}/C_ratio_to_moving_average.png",
-                "D_link_relatives": f"{run_id}/plots/{safe_municipality_name}/D_link_relatives.png",
-                "E_ratio_to_median": f"{run_id}/plots/{safe_municipality_name}/E_ratio_to_median.png",
-            },
-        }
-
-    # Save numeric indices to CSV (CSV can store blanks; we use None -> NaN in pandas)
-    csv_rows = []
-    for municipality_name, municipality_result in results.items():
-        for month_number in range(1, 13):
-            csv_rows.append({
-                "municipality": municipality_name,
-                "month": month_number,
-                "A_simple_averages": municipality_result["A_simple_averages"][month_number - 1],
-                "B_ratio_to_trend": municipality_result["B_ratio_to_trend"][month_number - 1],
-                "C_ratio_to_moving_average": municipality_result["C_ratio_to_moving_average"][month_number - 1],
-                "D_link_relatives": municipality_result["D_link_relatives"][month_number - 1],
-                "E_ratio_to_median": municipality_result["E_ratio_to_median"][month_number - 1],
-            })
-
+    # prepare_monthly already sorted rows by municipality, so groups come out in key order
+    groups = [("OVERALL", monthly_dataframe)] + list(monthly_dataframe.groupby("municipality", sort=False, observed=True))
+    group_names = [municipality_name for municipality_name, _ in groups]
+    group_rows = [municipality_rows for _, municipality_rows in groups]
+    safe_group_names = [safe_filename_component(municipality_name) for municipality_name in group_names]
+
+    # Create every plot folder up front (once per distinct name)
+    for safe_municipality_name in set(safe_group_names):
+        os.makedirs(os.path.join(plots_dir, safe_municipality_name), exist_ok=True)
+
+    # Each municipality is independent (indices + plots), so fan out across
+    # the shared worker pool when there are enough of them.
+    process_arguments = (
+        group_names,
+        group_rows,
+        repeat(metric_col),
+        repeat(plots_dir),
+        repeat(run_id),
+        safe_group_names,
+    )
+    group_results = None
+    if (os.cpu_count() or 1) > 1 and len(groups) >= PARALLEL_MIN_GROUPS:
+        process_pool = _process_pool()
+        try:
+            group_results = list(process_pool.map(_process_municipality, *process_arguments))
+        except BrokenProcessPool:
+            # A worker died: the next request builds a new pool, this one finishes serially
+            _discard_process_pool(process_pool)
+    if group_results is None:
+        group_results = list(map(_process_municipality, *process_arguments))
+
+    results: Dict[str, Any] = dict(zip(group_names, group_results))
+
+    # Save numeric indices to CSV, streaming one row per municipality/month (None -> blank cell)
     os.makedirs(run_dir, exist_ok=True)
-    pd.DataFrame(csv_rows).to_csv(os.path.join(run_dir, "seasonality_indices.csv"), index=False)
+    with open(os.path.join(run_dir, "seasonality_indices.csv"), "w", newline="", encoding="utf-8") as csv_file:
+        csv_writer = csv.writer(csv_file, lineterminator=os.linesep)
+        csv_writer.writerow(["municipality", "month", *INDEX_KEYS])
+        for municipality_name, municipality_result in results.items():
+            index_columns = [municipality_result[index_key] for index_key in INDEX_KEYS]
+            for month_number in range(1, 13):
+                csv_writer.writerow(
+                    [municipality_name, month_number]
+                    + [index_values[month_number - 1] for index_values in index_columns]
+                )
 
     return {
         "run_id": run_id,
@@ -1,20 +1,17 @@
 import numpy as np
-import pandas as pd
-from .utils import scale_base100_to_sum1200
+from .utils import monthly_mean, scale_base100_to_sum1200
 
 
-def link_relatives(monthly_dataframe: pd.DataFrame) -> np.ndarray:
+def link_relatives(y: np.ndarray, month: np.ndarray) -> np.ndarray:
     """
     Link Relatives seasonality index (monthly, base=100, normalized to sum=1200).
 
-    Expects monthly_dataframe to contain:
-      - 'y'     : metric values (float/int)
-      - 'month' : integers 1..12
+    Expects aligned arrays:
+      - y     : metric values (float/int)
+      - month : integers 1..12
       - sorted by time (year_month) BEFORE calling this function (your prepare_monthly() should do that)
     """
-    dataframe = monthly_dataframe.copy()
-
-    metric_values = dataframe["y"].astype(float).to_numpy()
+    metric_values = np.asarray(y, dtype=float)
 
     # Compute link relatives (percent), LR_t = (Y_t / Y_{t-1}) * 100
     # First element has no previous month -> NaN
@@ -30,28 +27,24 @@ def link_relatives(monthly_dataframe: pd.DataFrame) -> np.ndarray:
     computed_lr[valid_division_mask] = (current_values[valid_division_mask] / previous_values[valid_division_mask]) * 100.0
 
     link_relative_percent[1:] = computed_lr
-    dataframe["link_relative_percent"] = link_relative_percent
 
     # Average link relatives per calendar month (Jan..Dec)
     # Note: month=1 (January) usually has NaN because it has no previous month in each year
-    average_link_relative_by_month = (
-        dataframe.groupby("month")["link_relative_percent"]
-        .mean()
-        .reindex(range(1, 13))
+    average_link_relative_by_month = monthly_mean(
+        link_relative_percent,
+        month,
     )
 
     # Chain the seasonal index:
     # Start January at 100, then:
     # S_m = S_{m-1} * (avgLR_m / 100)
-    chained_seasonal_index = np.zeros(12, dtype=float)
-    chained_seasonal_index[0] = 100.0  # January
-
-    for month_index in range(1, 12):  # 1..11 corresponds to Feb..Dec
-        average_lr_percent = average_link_relative_by_month.iloc[month_index]  # Feb is index 1, etc.
-
-        if np.isnan(average_lr_percent) or average_lr_percent == 0:
-            chained_seasonal_index[month_index] = np.nan
-        else:
-            chained_seasonal_index[month_index] = chained_seasonal_index[month_index - 1] * (average_lr_percent / 100.0)
+    # A missing (NaN) or zero average LR makes that month and all later ones NaN.
+    average_lr_percent = average_link_relative_by_month[1:]  # Feb..Dec
+    chain_ratios = np.where(
+        np.isnan(average_lr_percent) | (average_lr_percent == 0),
+        np.nan,
+        average_lr_percent / 100.0,
+    )
+    chained_seasonal_index = 100.0 * np.concatenate(([1.0], np.cumprod(chain_ratios)))
 
     return scale_base100_to_sum1200(chained_seasonal_index)
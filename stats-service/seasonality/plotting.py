@@ -1,20 +1,35 @@
-import os
+import threading
 import numpy as np
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from .utils import MONTH_LABELS
 
+# One reusable Agg figure per thread (and so per worker process), cleared between plots.
+_FIGURE_STATE = threading.local()
+
+
+def _figure_and_axes():
+    if getattr(_FIGURE_STATE, "figure", None) is None:
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        _FIGURE_STATE.figure = figure
+        _FIGURE_STATE.axes = figure.add_subplot(111)
+    return _FIGURE_STATE.figure, _FIGURE_STATE.axes
+
+
 def plot_seasonal_index(si_base100_12: np.ndarray, title: str, outpath: str) -> None:
-    os.makedirs(os.path.dirname(outpath), exist_ok=True)
+    """
+    Saves the 12-month index line plot to outpath (its folder must already exist).
+    """
     x = np.arange(1, 13)
 
-    plt.figure()
-    plt.plot(x, si_base100_12, marker="o")
-    plt.xticks(x, MONTH_LABELS)
-    plt.xlabel("Month")
-    plt.ylabel("Seasonal index (base 100, sum=1200)")
-    plt.title(title)
-    plt.tight_layout()
-    plt.savefig(outpath, dpi=170)
-    plt.close()
+    figure, axes = _figure_and_axes()
+    axes.clear()
+    axes.plot(x, si_base100_12, marker="o")
+    axes.set_xticks(x)
+    axes.set_xticklabels(MONTH_LABELS)
+    axes.set_xlabel("Month")
+    axes.set_ylabel("Seasonal index (base 100, sum=1200)")
+    axes.set_title(title)
+    figure.tight_layout()
+    figure.savefig(outpath, dpi=170)
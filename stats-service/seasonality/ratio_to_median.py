@@ -2,20 +2,18 @@ import numpy as np
 import pandas as pd
 from .utils import scale_base100_to_sum1200
 
-def ratio_to_median(monthly_dataframe: pd.DataFrame) -> np.ndarray:
+def ratio_to_median(y: np.ndarray, month: np.ndarray) -> np.ndarray:
     """
     E) Ratio-to-median seasonal index.
     Robust alternative to simple averages.
     Produces 12 monthly values.
     """
-    dataframe = monthly_dataframe.copy()
-
     monthly_medians = (
-        dataframe.groupby("month")["y"]
+        pd.Series(y)
+        .groupby(month)
         .median()
         .reindex(range(1, 13))
-        .astype(float)
-        .to_numpy()
+        .to_numpy(dtype=float)
     )
 
     overall_median = float(np.nanmedian(monthly_medians))
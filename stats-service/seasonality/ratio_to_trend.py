@@ -1,55 +1,47 @@
 import numpy as np
-import pandas as pd
-from .utils import scale_base100_to_sum1200
+from .utils import monthly_mean, scale_base100_to_sum1200
 
 
-def _fallback_trend_hat_log_linear(prepared_dataframe: pd.DataFrame) -> pd.Series:
+def _fallback_trend_hat_log_linear(y: np.ndarray, time_index: np.ndarray) -> np.ndarray:
     """
     Estimates the trend using a log-linear model:
         log(y_t) = a + b * time_index
     """
 
-    observed_values = prepared_dataframe["y"].astype(float).clip(lower=1e-9)
-    time_index = prepared_dataframe["time_index"].to_numpy(dtype=float)
-
-    design_matrix = np.vstack([
-        np.ones(len(prepared_dataframe)),
-        time_index
-    ]).T
-
-    intercept, slope = np.linalg.lstsq(
-        design_matrix,
-        np.log(observed_values),
-        rcond=None
-    )[0]
-
-    trend_estimate = np.exp(intercept + slope * time_index)
-    return pd.Series(trend_estimate, index=prepared_dataframe.index)
-
-
-def ratio_to_trend(monthly_prepared_dataframe: pd.DataFrame) -> np.ndarray:
-    prepared_dataframe = monthly_prepared_dataframe.copy()
-
-    if "trend_hat" not in prepared_dataframe.columns:
-        prepared_dataframe["trend_hat"] = _fallback_trend_hat_log_linear(
-            prepared_dataframe
-        )
-    else:
-        prepared_dataframe["trend_hat"] = pd.to_numeric(
-            prepared_dataframe["trend_hat"],
-            errors="coerce"
-        )
-
-    ratio_observed_to_trend = (
-        prepared_dataframe["y"] / prepared_dataframe["trend_hat"]
-    ).replace([np.inf, -np.inf], np.nan)
-
-    mean_ratio_by_calendar_month = (
-        ratio_observed_to_trend
-        .groupby(prepared_dataframe["month"])
-        .mean()
-        .reindex(range(1, 13))
-    )
-
-    seasonal_indices_base100 = 100.0 * mean_ratio_by_calendar_month.to_numpy(dtype=float)
+    observed_values = np.clip(np.asarray(y, dtype=float), 1e-9, None)
+    time_index = np.asarray(time_index, dtype=float)
+    log_values = np.log(observed_values)
+
+    # Closed-form least squares for a straight line (no SVD needed for 2 columns)
+    time_mean = time_index.mean()
+    log_mean = log_values.mean()
+    time_centered = time_index - time_mean
+    time_sum_of_squares = float(time_centered @ time_centered)
+
+    slope = float(time_centered @ (log_values - log_mean)) / time_sum_of_squares if time_sum_of_squares > 0 else 0.0
+    intercept = log_mean - slope * time_mean
+
+    return np.exp(intercept + slope * time_index)
+
+
+def ratio_to_trend(
+    y: np.ndarray,
+    month: np.ndarray,
+    time_index: np.ndarray,
+    trend_hat: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Ratio-to-trend seasonal index. Uses the supplied trend_hat when given,
+    otherwise a log-linear trend fitted on time_index.
+    """
+    if trend_hat is None:
+        trend_hat = _fallback_trend_hat_log_linear(y, time_index)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio_observed_to_trend = np.asarray(y, dtype=float) / np.asarray(trend_hat, dtype=float)
+    ratio_observed_to_trend[np.isinf(ratio_observed_to_trend)] = np.nan
+
+    mean_ratio_by_calendar_month = monthly_mean(ratio_observed_to_trend, month)
+
+    seasonal_indices_base100 = 100.0 * mean_ratio_by_calendar_month
     return scale_base100_to_sum1200(seasonal_indices_base100)
@@ -1,5 +1,48 @@
+import numpy as np
 import pandas as pd
 
+
+# The dtype pandas' own parser returns (datetime64[ns] on pandas 2, [us] on pandas 3),
+# so the NumPy fast path yields exactly what the pandas fallback would.
+_PARSED_DATE_DTYPE = pd.to_datetime(pd.Series(["2000-01-01"]), format="%Y-%m-%d").dtype
+
+# Years every unit above can hold (datetime64[ns] spans 1677-09 .. 2262-04)
+_FAST_PATH_FIRST_YEAR = 1678
+_FAST_PATH_LAST_YEAR = 2261
+
+
+def _parse_year_month(year_month: pd.Series) -> np.ndarray:
+    """
+    Parses "YYYY-MM" strings to datetimes (first day of the month), NaT if invalid.
+
+    Well-formed values are cast straight to datetime64[M] by NumPy. NumPy is more
+    lenient than the strict "%Y-%m" format (it accepts "2024" or "2024-01-15"),
+    so only exact "YYYY-MM" values within 1678..2261 take that path; the rest
+    go through pandas, which decides how out-of-range years are represented.
+    """
+    year_month = year_month.astype(str)
+    dates = np.full(len(year_month), np.datetime64("NaT"), dtype=_PARSED_DATE_DTYPE)
+
+    fallback_mask = ~year_month.str.fullmatch(r"\d{4}-\d{2}").to_numpy(dtype=bool)
+    try:
+        well_formed_positions = np.flatnonzero(~fallback_mask)
+        well_formed = year_month.to_numpy()[well_formed_positions].astype("datetime64[M]")
+        years = well_formed.view("i8") // 12 + 1970
+        in_range = (years >= _FAST_PATH_FIRST_YEAR) & (years <= _FAST_PATH_LAST_YEAR)
+        dates[well_formed_positions[in_range]] = well_formed[in_range]
+        fallback_mask[well_formed_positions[~in_range]] = True
+    except ValueError:
+        # e.g. month "13": let pandas coerce every row
+        fallback_mask[:] = True
+
+    if fallback_mask.any():
+        dates[fallback_mask] = pd.to_datetime(
+            year_month[fallback_mask] + "-01", format="%Y-%m-%d", errors="coerce"
+        ).to_numpy(dtype=_PARSED_DATE_DTYPE)
+
+    return dates
+
+
 def to_canonical_monthly_df(
     raw_df: pd.DataFrame,
     metric_col: str,
@@ -18,7 +61,7 @@ def to_canonical_monthly_df(
         raise ValueError(f"Missing required metric column: {metric_col}")
 
     # Parse "YYYY-MM" -> datetime of first day of that month.
-    df["date"] = pd.to_datetime(df[year_month_col].astype(str) + "-01", format="%Y-%m-%d", errors="coerce")
+    df["date"] = _parse_year_month(df[year_month_col])
 
     df["municipality"] = df[municipality_col].astype(str)
     df["y"] = pd.to_numeric(df[metric_col], errors="coerce")
@@ -1,11 +1,10 @@
 import numpy as np
-import pandas as pd
-from .utils import scale_base100_to_sum1200
+from .utils import monthly_mean, scale_base100_to_sum1200
 
-def simple_averages(df: pd.DataFrame) -> np.ndarray:
-    overall_mean = df["y"].mean()
-    month_means = df.groupby("month")["y"].mean().reindex(range(1, 13))
+def simple_averages(y: np.ndarray, month: np.ndarray) -> np.ndarray:
+    overall_mean = np.nanmean(y)
+    month_means = monthly_mean(y, month)
 
-    si = (month_means / overall_mean).to_numpy(dtype=float)
+    si = month_means / overall_mean
     si_base100 = 100.0 * si
     return scale_base100_to_sum1200(si_base100)
@@ -1,7 +1,53 @@
+import math
+import re
+import threading
+
 import numpy as np
+import orjson
 import pandas as pd
 
+from ._numba_core import NUMBA_AVAILABLE, centered_moving_average_even
+
+# Anything that is not alphanumeric (str.isalnum, Unicode-aware) becomes "_"
+_UNSAFE_FILENAME_CHARS = re.compile(r"[\W_]")
+# Same rule as a translate table for the common all-ASCII name (no regex engine)
+_ASCII_FILENAME_TABLE = str.maketrans({code: "_" for code in range(128) if not chr(code).isalnum()})
+
+# Per-thread scratch for the NumPy centered moving average, grown on demand and reused
+_MA_SCRATCH = threading.local()
+
 MONTH_LABELS = ["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]
+# Array form for vectorized lookups: MONTH_LABELS_ARR[month - 1]
+MONTH_LABELS_ARR = np.array(MONTH_LABELS, dtype="<U3")
+
+def _sort_monthly_single(prepared_dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Single series: one stable argsort on the int64 view of the dates.
+    """
+    date_values = prepared_dataframe["date"].to_numpy().view("i8")
+    # Already chronological (the usual case): a stable sort would be the identity
+    if (np.diff(date_values) >= 0).all():
+        return prepared_dataframe
+    return prepared_dataframe.take(np.argsort(date_values, kind="stable"))
+
+
+def _sort_monthly_grouped(prepared_dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Several municipalities: by municipality, then date.
+    """
+    # Sort by integer municipality codes (sort=True keeps alphabetical order)
+    # instead of comparing strings; lexsort is stable like sort_values.
+    municipality_codes, municipality_names = pd.factorize(prepared_dataframe["municipality"].to_numpy(), sort=True)
+    # Reuse those codes as a categorical column so the later groupby hashes ints, not strings
+    prepared_dataframe["municipality"] = pd.Categorical.from_codes(municipality_codes, categories=municipality_names)
+    date_values = prepared_dataframe["date"].to_numpy().view("i8")
+
+    # Already ordered by (municipality, date): a stable lexsort would be the identity
+    code_steps = np.diff(municipality_codes)
+    if ((code_steps > 0) | ((code_steps == 0) & (np.diff(date_values) >= 0))).all():
+        return prepared_dataframe
+    return prepared_dataframe.take(np.lexsort((date_values, municipality_codes)))
+
 
 def prepare_monthly(input_monthly_dataframe: pd.DataFrame) -> pd.DataFrame:
     """
@@ -11,50 +57,140 @@ def prepare_monthly(input_monthly_dataframe: pd.DataFrame) -> pd.DataFrame:
       - 'month' column contains calendar month (1..12)
       - 'time_index' is a sequential month index (0..N-1)
     """
-    prepared_dataframe = input_monthly_dataframe.copy()
+    # Shallow copy: columns are only replaced/added below, never written in place,
+    # so the caller's frame is left untouched without duplicating its data.
+    prepared_dataframe = input_monthly_dataframe.copy(deep=False)
 
-    prepared_dataframe["date"] = pd.to_datetime(prepared_dataframe["date"])
+    # Already-parsed dates (e.g. from to_canonical_monthly_df) skip a full conversion pass
+    if not pd.api.types.is_datetime64_dtype(prepared_dataframe["date"]):
+        prepared_dataframe["date"] = pd.to_datetime(prepared_dataframe["date"])
 
     if "municipality" in prepared_dataframe.columns:
-        prepared_dataframe = prepared_dataframe.sort_values(["municipality", "date"])
+        prepared_dataframe = _sort_monthly_grouped(prepared_dataframe)
     else:
-        prepared_dataframe = prepared_dataframe.sort_values("date")
-
-    prepared_dataframe["month"] = prepared_dataframe["date"].dt.month
+        prepared_dataframe = _sort_monthly_single(prepared_dataframe)
 
-    first_year_in_series = prepared_dataframe["date"].dt.year.min()
-    prepared_dataframe["time_index"] = (
-        (prepared_dataframe["date"].dt.year - first_year_in_series) * 12
-        + (prepared_dataframe["date"].dt.month - 1)
+    # Months since 1970-01 from a single datetime64[M] cast (no repeated .dt accessors)
+    months_since_epoch = (
+        prepared_dataframe["date"].to_numpy().astype("datetime64[M]").view("i8")
     )
 
+    # Narrow dtypes: month fits int8 and a month count int32; consumers cast as needed
+    prepared_dataframe["month"] = (months_since_epoch % 12 + 1).astype(np.int8)
+
+    # Counted from January of the first year in the series
+    # (an empty frame, e.g. every row dropped as invalid, has no first month: anchor at 0)
+    first_january_in_series = (months_since_epoch.min() // 12) * 12 if len(months_since_epoch) else 0
+    prepared_dataframe["time_index"] = (months_since_epoch - first_january_in_series).astype(np.int32)
+
     return prepared_dataframe
 
 
 
-def scale_base100_to_sum1200(seasonal_index_base100_12: np.ndarray) -> np.ndarray:
-    seasonal_index = np.asarray(seasonal_index_base100_12, dtype=float)
-    total = float(np.nansum(seasonal_index))
-    if (not np.isfinite(total)) or total == 0.0:
+def scale_base100_to_sum1200(seasonal_index_base100_12: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """
+    Rescales the indices so they sum to 1200 (NaN ignored). dtype sets the
+    returned array type (e.g. np.float32 for bulk use); the total is always
+    accumulated in float64.
+    """
+    # One owned copy, summed with NaN masked out (no nansum temporary) and scaled in place
+    seasonal_index = np.array(seasonal_index_base100_12, dtype=dtype)
+    total = float(np.add.reduce(seasonal_index, where=~np.isnan(seasonal_index), dtype=np.float64))
+    if (not math.isfinite(total)) or total == 0.0:
         return seasonal_index
-    return seasonal_index * (1200.0 / total)
+    np.multiply(seasonal_index, 1200.0 / total, out=seasonal_index)
+    return seasonal_index
+
+
+def monthly_mean(values, months) -> np.ndarray:
+    """
+    Mean of values per calendar month (1..12), ignoring NaN.
+    Months without any valid value are NaN. Returns a length-12 array (Jan..Dec).
+    """
+    values = np.asarray(values, dtype=float)
+    months = np.asarray(months, dtype=np.intp)
+
+    valid = ~np.isnan(values)
+    sums = np.bincount(months[valid], weights=values[valid], minlength=13)[1:13]
+    counts = np.bincount(months[valid], minlength=13)[1:13]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan)
 
 
 def safe_filename_component(text: str) -> str:
-    return "".join(ch if ch.isalnum() else "_" for ch in str(text))
+    text = str(text)
+    if text.isascii():
+        return text.translate(_ASCII_FILENAME_TABLE)
+    return _UNSAFE_FILENAME_CHARS.sub("_", text)
+
+
+def _moving_average_scratch(name: str, length: int, dtype=np.float64) -> np.ndarray:
+    buffer = getattr(_MA_SCRATCH, name, None)
+    if buffer is None or buffer.size < length:
+        buffer = np.empty(length, dtype=dtype)
+        setattr(_MA_SCRATCH, name, buffer)
+    return buffer[:length]
 
 
 def centered_moving_average_even_window(series: pd.Series, window: int) -> pd.Series:
     if window % 2 != 0:
         raise ValueError("This helper is for even window sizes only.")
-    moving_average = series.rolling(window=window, center=False).mean()
-    centered_moving_average = (moving_average + moving_average.shift(-1)) / 2.0
-    return centered_moving_average
+    # Position i averages the trailing means ending at i and i + 1. Both paths
+    # below are O(N) whatever the window (running sum / prefix sum).
+    values = series.to_numpy(dtype=float)
+    centered_moving_average = np.full(len(values), np.nan)
+
+    if NUMBA_AVAILABLE:
+        # Single running-sum pass in nopython mode, written straight into the output
+        centered_moving_average_even(values, window, centered_moving_average)
+    elif len(values) > window:
+        # Every intermediate lives in the per-thread scratch; only the output is new
+        n = len(values)
+        window_count = n - window + 1
+        non_finite = _moving_average_scratch("non_finite", n, dtype=bool)
+        float_scratch = _moving_average_scratch("float", 2 * (n + 1) + window_count)
+        prefix_sum = float_scratch[:n + 1]
+        prefix_non_finite = float_scratch[n + 1:2 * (n + 1)]
+        trailing_mean = float_scratch[2 * (n + 1):]
+
+        # NaN/Inf are summed as 0 and counted apart, so they only spoil their own windows
+        np.isfinite(values, out=non_finite)
+        np.logical_not(non_finite, out=non_finite)
+        prefix_sum[0] = 0.0
+        np.copyto(prefix_sum[1:], values)
+        prefix_sum[1:][non_finite] = 0.0
+        np.cumsum(prefix_sum[1:], out=prefix_sum[1:])
+        prefix_non_finite[0] = 0.0
+        np.copyto(prefix_non_finite[1:], non_finite)
+        np.cumsum(prefix_non_finite[1:], out=prefix_non_finite[1:])
+
+        np.subtract(prefix_sum[window:], prefix_sum[:-window], out=trailing_mean)
+        trailing_mean /= window
+        # Windows holding a NaN/Inf; the non-finite mask is no longer needed, reuse it
+        spoiled_windows = non_finite[:window_count]
+        np.not_equal(prefix_non_finite[window:], prefix_non_finite[:-window], out=spoiled_windows)
+        trailing_mean[spoiled_windows] = np.nan
+
+        centered_window = centered_moving_average[window - 1:-1]
+        np.add(trailing_mean[:-1], trailing_mean[1:], out=centered_window)
+        centered_window *= 0.5
+
+    # The output array is fresh and owned here, so pandas need not copy it
+    return pd.Series(centered_moving_average, index=series.index, copy=False)
+
+def dumps_safe(obj) -> bytes:
+    """
+    Serializes obj to JSON bytes with orjson. NumPy arrays/scalars are encoded
+    natively and NaN/Inf become null, so no Python-level coercion pass is needed.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
 
-def json_safe(value):
-    if isinstance(value, float) and (np.isnan(value) or np.isinf(value)):
-        return None
-    return value
 
 def json_safe_list(values):
-    return [json_safe(float(v)) for v in values]
\ No newline at end of file
+    # One finiteness pass in NumPy; only the (usually few) NaN/Inf slots are patched in Python
+    values_array = np.asarray(values, dtype=float)
+    safe_values = values_array.tolist()
+    for position in np.flatnonzero(~np.isfinite(values_array)):
+        safe_values[position] = None
+    return safe_values